@@ -304,7 +304,7 @@ def main() -> None:
         args.show_ffmpeg_output,
     )
 
-    if args.debug and args.input == []:
+    if args.debug and not args.input:
         import platform as plat
 
         is64bit = "64-bit" if sys.maxsize > 2**32 else "32-bit"
@@ -314,7 +314,7 @@ def main() -> None:
         print(f"Auto-Editor Version: {auto_editor.version}")
         sys.exit()
 
-    if args.input == []:
+    if not args.input:
         log.error("You need to give auto-editor an input file.")
 
     temp = setup_tempdir(args.temp_dir, Log())
@@ -52,6 +52,7 @@ VAL, QUOTE, SEC, DB, DOT, VLIT = "VAL", "QUOTE", "SEC", "DB", "DOT", "VLIT"
 SEC_UNITS = ("s", "sec", "secs", "second", "seconds")
 METHODS = ("audio:", "motion:", "subtitle:")
 brac_pairs = {LPAREN: RPAREN, LBRAC: RBRAC, LCUR: RCUR}
+hash_bools = {"t": True, "T": True, "true": True, "f": False, "F": False, "false": False}
 
 str_escape = {
     "a": "\a",
@@ -216,11 +217,9 @@ class Lexer:
             self.advance()
 
         result = buf.getvalue()
-        if result in ("t", "T", "true"):
-            return Token(VAL, True)
-
-        if result in ("f", "F", "false"):
-            return Token(VAL, False)
+        boolean = hash_bools.get(result)
+        if boolean is not None:
+            return Token(VAL, boolean)
 
         self.error(f"Unknown hash literal `#{result}`")
 
@@ -175,11 +175,12 @@ def make_timeline(
         except CoerceError as e:
             log.error(e)
 
-    def mut_set_range(arr: NDArray, _ranges: list[list[str]], index: float) -> None:
+    def mut_set_range(
+        arr: NDArray, _ranges: tuple[list[str], ...], index: float
+    ) -> None:
         for _range in _ranges:
             assert len(_range) == 2
-            pair = [parse_time(val, arr) for val in _range]
-            arr[pair[0] : pair[1]] = index
+            arr[parse_time(_range[0], arr) : parse_time(_range[1], arr)] = index
 
     try:
         if len(args.cut_out) > 0:
@@ -193,7 +194,7 @@ def make_timeline(
         for speed_range in args.set_speed_for_range:
             speed = speed_range[0]
             _range = list(speed_range[1:])
-            mut_set_range(speed_index, [_range], get_speed_index(speed))
+            mut_set_range(speed_index, (_range,), get_speed_index(speed))
     except CoerceError as e:
         log.error(e)
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from auto_editor.ffwrapper import FFmpeg, initFileInfo
 from auto_editor.utils.log import Log
@@ -12,7 +12,7 @@ from auto_editor.vanparse import ArgumentParser
 class DescArgs:
     ffmpeg_location: str | None = None
     help: bool = False
-    input: list[str] = field(default_factory=list)
+    input: tuple[str, ...] = ()
 
 
 def desc_options(parser: ArgumentParser) -> ArgumentParser:
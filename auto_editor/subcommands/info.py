@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os.path
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Literal, TypedDict
 
 from auto_editor.ffwrapper import FFmpeg, initFileInfo
@@ -19,7 +19,7 @@ class InfoArgs:
     ffmpeg_location: str | None = None
     my_ffmpeg: bool = False
     help: bool = False
-    input: list[str] = field(default_factory=list)
+    input: tuple[str, ...] = ()
 
 
 def info_options(parser: ArgumentParser) -> ArgumentParser:
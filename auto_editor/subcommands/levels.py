@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -25,7 +25,7 @@ if TYPE_CHECKING:
 
 @dataclass(slots=True)
 class LevelArgs:
-    input: list[str] = field(default_factory=list)
+    input: tuple[str, ...] = ()
     edit: str = "audio"
     timebase: Fraction | None = None
     ffmpeg_location: str | None = None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from fractions import Fraction
 
 import auto_editor
@@ -25,7 +25,7 @@ except ImportError:
 
 @dataclass(slots=True)
 class REPL_Args:
-    input: list[str] = field(default_factory=list)
+    input: tuple[str, ...] = ()
     debug_parser: bool = False
     timebase: Fraction | None = None
     ffmpeg_location: str | None = None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 import sys
 import tempfile
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from auto_editor.ffwrapper import FFmpeg, initFileInfo
 from auto_editor.utils.log import Log
@@ -15,7 +15,7 @@ class SubArgs:
     ffmpeg_location: str | None = None
     my_ffmpeg: bool = False
     help: bool = False
-    input: list[str] = field(default_factory=list)
+    input: tuple[str, ...] = ()
 
 
 def subdump_options(parser: ArgumentParser) -> ArgumentParser:
@@ -6,7 +6,7 @@ import shutil
 import subprocess
 import sys
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from fractions import Fraction
 from time import perf_counter
 from typing import Any
@@ -23,7 +23,7 @@ from auto_editor.vanparse import ArgumentParser
 
 @dataclass(slots=True)
 class TestArgs:
-    only: list[str] = field(default_factory=list)
+    only: tuple[str, ...] = ()
     help: bool = False
     no_fail_fast: bool = False
     category: str = "cli"
@@ -122,7 +122,7 @@ def run_tests(tests: list[Callable], args: TestArgs) -> None:
         clean("resources")
         clean(os.getcwd())
 
-    if args.only != []:
+    if args.only:
         tests = list(filter(lambda t: t.__name__ in args.only, tests))
 
     total_time = 0.0
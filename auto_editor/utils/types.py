@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from fractions import Fraction
+from functools import lru_cache
 from typing import Literal
 
 
@@ -10,30 +12,23 @@ class CoerceError(Exception):
     pass
 
 
-def _comma_coerce(name: str, val: str, num_args: int) -> list[str]:
-    vals = val.strip().split(",")
-    if num_args > len(vals):
-        raise CoerceError(f"Too few arguments for {name}.")
-    if len(vals) > num_args:
-        raise CoerceError(f"Too many arguments for {name}.")
-    return vals
+_HEXSET = frozenset("0123456789abcdef")
+_scan_num_prefix = re.compile(r"[0-9_ .-]*").match
+_FRAC_RE = re.compile(r"\s*([-+]?\d(?:_?\d)*)\s*/\s*([-+]?\d(?:_?\d)*)\s*\Z")
 
 
 def _split_num_str(val: str | float) -> tuple[float, str]:
     if isinstance(val, float | int):
         return val, ""
 
-    index = 0
-    for char in val:
-        if char not in "0123456789_ .-":
-            break
-        index += 1
+    m = _scan_num_prefix(val)
+    assert m is not None
+    index = m.end()
     num, unit = val[:index], val[index:]
     try:
-        float(num)
+        return float(num), unit
     except ValueError:
         raise CoerceError(f"Invalid number: '{val}'")
-    return float(num), unit
 
 
 def _unit_check(unit: str, allowed_units: tuple[str, ...]) -> None:
@@ -46,29 +41,28 @@ def natural(val: str | float) -> int:
     num, unit = _split_num_str(val)
     if unit != "":
         raise CoerceError(f"'{val}': Natural does not allow units.")
-    if not isinstance(num, int) and not num.is_integer():
+    try:
+        result = int(num)
+    except (ValueError, OverflowError):
         raise CoerceError(f"'{val}': Natural must be a valid integer.")
-    if num < 0:
+    if result != num:
+        raise CoerceError(f"'{val}': Natural must be a valid integer.")
+    if result < 0:
         raise CoerceError(f"'{val}': Natural cannot be negative.")
-    return int(num)
+    return result
 
 
 def number(val: str | float) -> float:
     if isinstance(val, str) and "/" in val:
-        nd = val.split("/")
-        if len(nd) != 2:
-            raise CoerceError(f"'{val}': One divisor allowed.")
-        vs = []
-        for v in nd:
-            try:
-                vs.append(int(v))
-            except ValueError:
-                raise CoerceError(
-                    f"'{val}': Numerator and Denominator must be integers."
-                )
-        if vs[1] == 0:
+        m = _FRAC_RE.match(val)
+        if m is None:
+            if val.count("/") != 1:
+                raise CoerceError(f"'{val}': One divisor allowed.")
+            raise CoerceError(f"'{val}': Numerator and Denominator must be integers.")
+        denominator = int(m[2])
+        if denominator == 0:
             raise CoerceError(f"'{val}': Denominator must not be zero.")
-        return vs[0] / vs[1]
+        return int(m[1]) / denominator
 
     num, unit = _split_num_str(val)
     if unit == "%":
@@ -84,6 +78,7 @@ def speed(val: str) -> float:
     return _s
 
 
+@lru_cache(maxsize=64)
 def threshold(val: str | float) -> float:
     num = number(val)
     if num > 1 or num < 0:
@@ -91,18 +86,21 @@ def threshold(val: str | float) -> float:
     return num
 
 
+_FRAME_RATE_PRESETS = {
+    "ntsc": Fraction(30000, 1001),
+    "ntsc_film": Fraction(24000, 1001),
+    "pal": Fraction(25),
+    "film": Fraction(24),
+}
+
+
+@lru_cache(maxsize=64)
 def frame_rate(val: str) -> Fraction:
-    if val == "ntsc":
-        return Fraction(30000, 1001)
-    if val == "ntsc_film":
-        return Fraction(24000, 1001)
-    if val == "pal":
-        return Fraction(25)
-    if val == "film":
-        return Fraction(24)
-    return Fraction(val)
+    preset = _FRAME_RATE_PRESETS.get(val)
+    return Fraction(val) if preset is None else preset
 
 
+@lru_cache(maxsize=64)
 def sample_rate(val: str) -> int:
     num, unit = _split_num_str(val)
     if unit in ("kHz", "KHz"):
@@ -122,36 +120,52 @@ def bitrate(val: str) -> str:
     return val
 
 
+_TIME_UNITS = {
+    "s": 1,
+    "sec": 1,
+    "secs": 1,
+    "second": 1,
+    "seconds": 1,
+    "min": 60,
+    "mins": 60,
+    "minute": 60,
+    "minutes": 60,
+    "hour": 3600,
+}
+
+
 def time(val: str, tb: Fraction) -> int:
-    if ":" in val:
-        boxes = val.split(":")
-        if len(boxes) == 2:
-            return round((int(boxes[0]) * 60 + float(boxes[1])) * tb)
-        if len(boxes) == 3:
-            return round(
-                (int(boxes[0]) * 3600 + int(boxes[1]) * 60 + float(boxes[2])) * tb
-            )
-        raise CoerceError(f"'{val}': Invalid time format")
+    hours, sep, rest = val.partition(":")
+    if sep:
+        mins, sep, secs = rest.partition(":")
+        if not sep:
+            return round((int(hours) * 60 + float(mins)) * tb)
+        if ":" in secs:
+            raise CoerceError(f"'{val}': Invalid time format")
+        return round((int(hours) * 3600 + int(mins) * 60 + float(secs)) * tb)
 
     num, unit = _split_num_str(val)
-    if unit in ("s", "sec", "secs", "second", "seconds"):
-        return round(num * tb)
-    if unit in ("min", "mins", "minute", "minutes"):
-        return round(num * tb * 60)
-    if unit == "hour":
-        return round(num * tb * 3600)
+    mult = _TIME_UNITS.get(unit)
+    if mult is not None:
+        return round(num * tb * mult)
 
     if unit != "":
         raise CoerceError(f"'{val}': Time format got unknown unit: `{unit}`")
-    if not num.is_integer():
+    try:
+        result = int(num)
+    except (ValueError, OverflowError):
         raise CoerceError(f"'{val}': Time format expects: int?")
-    return int(num)
+    if result != num:
+        raise CoerceError(f"'{val}': Time format expects: int?")
+    return result
+
+
+_ANCHORS = frozenset(("tl", "tr", "bl", "br", "ce"))
 
 
 def anchor(val: str) -> str:
-    allowed = ("tl", "tr", "bl", "br", "ce")
-    if val not in allowed:
-        raise CoerceError(f"Anchor must be: {' '.join(allowed)}")
+    if val not in _ANCHORS:
+        raise CoerceError("Anchor must be: tl tr bl br ce")
     return val
 
 
@@ -165,12 +179,21 @@ def margin(val: str) -> tuple[str, str]:
 
 
 def time_range(val: str) -> list[str]:
-    return _comma_coerce("time_range", val, 2)
+    vals = val.strip().split(",")
+    if len(vals) < 2:
+        raise CoerceError("Too few arguments for time_range.")
+    if len(vals) > 2:
+        raise CoerceError("Too many arguments for time_range.")
+    return vals
 
 
 def speed_range(val: str) -> tuple[float, str, str]:
-    a = _comma_coerce("speed_range", val, 3)
-    return number(a[0]), a[1], a[2]
+    vals = val.strip().split(",")
+    if len(vals) < 3:
+        raise CoerceError("Too few arguments for speed_range.")
+    if len(vals) > 3:
+        raise CoerceError("Too many arguments for speed_range.")
+    return number(vals[0]), vals[1], vals[2]
 
 
 Stream = int | Literal["all"]
@@ -182,6 +205,7 @@ def stream(val: str) -> Stream:
     return natural(val)
 
 
+@lru_cache(maxsize=256)
 def color(val: str) -> str:
     """
     Convert a color str into an RGB tuple
@@ -192,16 +216,20 @@ def color(val: str) -> str:
         - 6 digit hex codes (#3F0401, #005601)
     """
 
-    color = val.lower()
-
-    if color in colormap:
-        color = colormap[color]
-
-    if re.match("#[a-f0-9]{3}$", color):
-        return "#" + "".join([x * 2 for x in color[1:]])
-
-    if re.match("#[a-f0-9]{6}$", color):
-        return color
+    if val.startswith("#") and val.islower():
+        color = val
+    else:
+        color = val.lower()
+        if color in colormap:
+            color = colormap[color]
+
+    if color.startswith("#"):
+        rest = color[1:]
+        if rest and set(rest) <= _HEXSET:
+            if len(rest) == 3:
+                return f"#{rest[0]}{rest[0]}{rest[1]}{rest[1]}{rest[2]}{rest[2]}"
+            if len(rest) == 6:
+                return color
 
     raise ValueError(f"Invalid Color: '{color}'")
 
@@ -216,7 +244,7 @@ def resolution(val: str | None) -> tuple[int, int] | None:
     return natural(vals[0]), natural(vals[1])
 
 
-@dataclass
+@dataclass(slots=True)
 class Args:
     yt_dlp_location: str = "yt-dlp"
     download_format: str | None = None
@@ -230,9 +258,9 @@ class Args:
     scale: float = 1.0
     extras: str | None = None
     no_seek: bool = False
-    cut_out: list[list[str]] = field(default_factory=list)
-    add_in: list[list[str]] = field(default_factory=list)
-    set_speed_for_range: list[tuple[float, str, str]] = field(default_factory=list)
+    cut_out: tuple[list[str], ...] = ()
+    add_in: tuple[list[str], ...] = ()
+    set_speed_for_range: tuple[tuple[float, str, str], ...] = ()
     frame_rate: Fraction | None = None
     sample_rate: int | None = None
     resolution: tuple[int, int] | None = None
@@ -258,7 +286,7 @@ class Args:
     video_speed: float = 1.0
     output_file: str | None = None
     help: bool = False
-    input: list[str] = field(default_factory=list)
+    input: tuple[str, ...] = ()
 
 
 colormap = {
@@ -412,3 +440,7 @@ colormap = {
     "yellow": "#ffff00",
     "yellowgreen": "#9acd32",
 }
+
+# Interned keys and values make dict hits an identity compare and let the
+# hex strings be shared wherever they flow downstream.
+colormap = {sys.intern(k): sys.intern(v) for k, v in colormap.items()}
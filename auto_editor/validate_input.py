@@ -66,7 +66,9 @@ def download_video(my_input: str, args: Args, ffmpeg: FFmpeg, log: Log) -> str:
     return location
 
 
-def valid_input(inputs: list[str], ffmpeg: FFmpeg, args: Args, log: Log) -> list[str]:
+def valid_input(
+    inputs: tuple[str, ...], ffmpeg: FFmpeg, args: Args, log: Log
+) -> list[str]:
     new_inputs = []
 
     for my_input in inputs:
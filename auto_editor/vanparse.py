@@ -119,7 +119,9 @@ def to_key(op: Options | Required) -> str:
     return op.names[0][:2].replace("-", "") + op.names[0][2:].replace("-", "_")
 
 
-def print_option_help(program_name: str | None, ns_obj: T, option: Options) -> None:
+def print_option_help(
+    program_name: str | None, ns_obj: type[T], option: Options
+) -> None:
     text = StringIO()
     text.write(
         f"  {', '.join(option.names)} {'' if option.metavar is None else option.metavar}\n\n"
@@ -131,9 +133,11 @@ def print_option_help(program_name: str | None, ns_obj: T, option: Options) -> N
         if option.nargs != 1:
             text.write(f"    nargs: {option.nargs}\n")
 
+        # Read the default off a throwaway instance; reading it off the class
+        # would return a member descriptor for slotted dataclasses.
         default: str | float | int | tuple | None = None
         try:
-            default = getattr(ns_obj, to_key(option))
+            default = getattr(ns_obj(), to_key(option))
         except AttributeError:
             pass
 
@@ -254,7 +258,7 @@ class ArgumentParser:
                 if oplist_name is not None:
                     try:
                         val = oplist_coerce(arg)
-                        ns.__setattr__(oplist_name, getattr(ns, oplist_name) + [val])
+                        ns.__setattr__(oplist_name, (*getattr(ns, oplist_name), val))
                     except (CoerceError, ValueError) as e:
                         Log().error(e)
                 elif requireds and not arg.startswith("--"):
@@ -306,7 +310,7 @@ class ArgumentParser:
             i += 1
 
         if setting_req_list:
-            ns.__setattr__(req_list_name, req_list)
+            ns.__setattr__(req_list_name, tuple(req_list))
 
         if getattr(ns, "help"):
             print_program_help(requireds, args)